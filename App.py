@@ -1,6 +1,8 @@
 # app.py
 import streamlit as st
 import pandas as pd
+import numpy as np
+import pyarrow as pa
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, date
@@ -14,156 +16,94 @@ st.set_page_config(
 )
 
 # === Data Preparation ===
-COUNTRIES = {
-    "United States": {
-        "currency": "USD",
-        "default_rate": 7.0,
-        "flag": "🇺🇸"
-    },
-    "Morocco": {
-        "currency": "MAD",
-        "default_rate": 6.5,
-        "flag": "🇲🇦"
-    },
-    "Eurozone": {
-        "currency": "EUR",
-        "default_rate": 4.5,
-        "flag": "🇪🇺"
-    },
-    "United Kingdom": {
-        "currency": "GBP",
-        "default_rate": 6.0,
-        "flag": "🇬🇧"
-    },
-    "Canada": {
-        "currency": "CAD",
-        "default_rate": 6.5,
-        "flag": "🇨🇦"
-    },
-    "Australia": {
-        "currency": "AUD",
-        "default_rate": 6.0,
-        "flag": "🇦🇺"
-    },
-    "South Africa": {
-        "currency": "ZAR",
-        "default_rate": 8.0,
-        "flag": "🇿🇦"
-    },
-    "India": {
-        "currency": "INR",
-        "default_rate": 7.5,
-        "flag": "🇮🇳"
-    },
-    "Brazil": {
-        "currency": "BRL",
-        "default_rate": 9.0,
-        "flag": "🇧🇷"
-    },
-    "Japan": {
-         "currency": "JPY",
-         "default_rate": 3.5,
-         "flag": "🇯🇵"
-    },
-    "Switzerland": {
-         "currency": "CHF",
-         "default_rate": 2.5,
-         "flag": "🇨🇭"
-    },
-    "Mexico": {
-         "currency": "MXN",
-         "default_rate": 11.0,
-         "flag": "🇲🇽"
+@st.cache_resource
+def get_countries():
+    """Country table, built once per server process and shared across reruns."""
+    return {
+        "United States": {
+            "currency": "USD",
+            "default_rate": 7.0,
+            "flag": "🇺🇸"
+        },
+        "Morocco": {
+            "currency": "MAD",
+            "default_rate": 6.5,
+            "flag": "🇲🇦"
+        },
+        "Eurozone": {
+            "currency": "EUR",
+            "default_rate": 4.5,
+            "flag": "🇪🇺"
+        },
+        "United Kingdom": {
+            "currency": "GBP",
+            "default_rate": 6.0,
+            "flag": "🇬🇧"
+        },
+        "Canada": {
+            "currency": "CAD",
+            "default_rate": 6.5,
+            "flag": "🇨🇦"
+        },
+        "Australia": {
+            "currency": "AUD",
+            "default_rate": 6.0,
+            "flag": "🇦🇺"
+        },
+        "South Africa": {
+            "currency": "ZAR",
+            "default_rate": 8.0,
+            "flag": "🇿🇦"
+        },
+        "India": {
+            "currency": "INR",
+            "default_rate": 7.5,
+            "flag": "🇮🇳"
+        },
+        "Brazil": {
+            "currency": "BRL",
+            "default_rate": 9.0,
+            "flag": "🇧🇷"
+        },
+        "Japan": {
+             "currency": "JPY",
+             "default_rate": 3.5,
+             "flag": "🇯🇵"
+        },
+        "Switzerland": {
+             "currency": "CHF",
+             "default_rate": 2.5,
+             "flag": "🇨🇭"
+        },
+        "Mexico": {
+             "currency": "MXN",
+             "default_rate": 11.0,
+             "flag": "🇲🇽"
+        }
     }
-}
+
+COUNTRIES = get_countries()
+COUNTRY_NAMES = tuple(COUNTRIES.keys())
+
+# Upper input bounds; schedules are checked accurate up to these, and far beyond them (1 + r) ** n overflows
+MAX_INTEREST_RATE = 100.0
+MAX_LOAN_TERM_YEARS = 100
+
+# Schedule columns displayed as currency amounts
+NUMERIC_COLS_YEARLY = ("Principal", "Interest", "Ending Balance")
+NUMERIC_COLS_MONTHLY = ("Principal", "Interest", "Ending Balance")
 
 # === Functions ===
-def calculate_mortgage(
-    home_value,
-    down_payment,
-    interest_rate,
-    loan_term_years,
-    start_date,
-    property_tax,
-    pmi_rate,
-    home_insurance,
-    hoa_fee,
-    override_rate=None,
-    override_term=None
-):
+def _compute_pmt(loan_amount, monthly_rate, loan_term_months):
     """
-    Calculate mortgage details.
+    Monthly principal & interest payment for a fully amortizing loan.
     """
-    try:
-        home_value = float(home_value)
-        down_payment = float(down_payment)
-        interest_rate_decimal = float(interest_rate) / 100
-        loan_term_years = int(loan_term_years)
-
-        if override_term and override_term > 0:
-            loan_term_years = int(override_term)
-
-        if override_rate is not None and override_rate > 0:
-            interest_rate_decimal = float(override_rate) / 100
-
-        loan_term_months = loan_term_years * 12
-
-        property_tax = float(property_tax)
-        pmi_rate_decimal = float(pmi_rate) / 100
-        home_insurance = float(home_insurance)
-        hoa_fee = float(hoa_fee)
-
-        loan_amount = home_value - down_payment
-        monthly_interest_rate = interest_rate_decimal / 12
-
-        if monthly_interest_rate > 0:
-            monthly_payment_principal_interest = (
-                loan_amount *
-                (monthly_interest_rate * (1 + monthly_interest_rate) ** loan_term_months) /
-                ((1 + monthly_interest_rate) ** loan_term_months - 1)
-            )
-        else:
-            monthly_payment_principal_interest = loan_amount / loan_term_months
-
-        pmi_monthly = loan_amount * pmi_rate_decimal / 12 if loan_amount > 0 else 0.0
-        property_tax_monthly = property_tax / 12 if property_tax > 0 else 0.0
-        home_insurance_monthly = home_insurance / 12 if home_insurance > 0 else 0.0
-
-        total_monthly_payment = (monthly_payment_principal_interest +
-                                property_tax_monthly + pmi_monthly +
-                                home_insurance_monthly + hoa_fee)
-
-        total_payments = total_monthly_payment * loan_term_months
-        total_interest_paid = (monthly_payment_principal_interest * loan_term_months) - loan_amount
-        annual_payment = total_monthly_payment * 12
-
-        loan_payoff_date = start_date.replace(year=start_date.year + loan_term_years)
-        if start_date.month == 2 and start_date.day == 29:
-            try:
-                loan_payoff_date = loan_payoff_date.replace(day=28)
-            except ValueError:
-                pass
-
-        results = {
-            "Loan Amount": loan_amount,
-            "Monthly Payment (P&I)": monthly_payment_principal_interest,
-            "Total Monthly Payment": total_monthly_payment,
-            "Total Interest Paid": total_interest_paid,
-            "Loan Payoff Date": loan_payoff_date.strftime("%b %Y"),
-            "Annual Payment Amount": annual_payment,
-            "Total Payments": total_payments,
-            "Property Tax Per Month": property_tax_monthly,
-            "PMI Per Month": pmi_monthly,
-            "Home Insurance Per Month": home_insurance_monthly,
-            "HOA Fee Per Month": hoa_fee,
-        }
-
-        return results
-    except Exception as e:
-        st.error(f"An error occurred during calculation: {e}")
-        return None
+    if monthly_rate > 0:
+        factor = (1 + monthly_rate) ** loan_term_months
+        return loan_amount * monthly_rate * factor / (factor - 1)
+    return loan_amount / loan_term_months
 
-def generate_yearly_schedule(
+def _validated_inputs(
     home_value,
     down_payment,
     interest_rate,
@@ -177,87 +117,46 @@ def generate_yearly_schedule(
     override_term=None
 ):
     """
-    Generate a yearly amortization schedule.
+    Coerce and check the raw widget values once, raising ValueError on invalid input.
+    Returns the keyword arguments for calculate_mortgage.
     """
-    try:
-        results = calculate_mortgage(
-            home_value, down_payment, interest_rate, loan_term_years, start_date,
-            property_tax, pmi_rate, home_insurance, hoa_fee,
-            override_rate=override_rate, override_term=override_term
-        )
+    inputs = {
+        "home_value": float(home_value),
+        "down_payment": float(down_payment),
+        "interest_rate": float(interest_rate),
+        "loan_term_years": int(loan_term_years),
+        "start_date": start_date,
+        "property_tax": float(property_tax),
+        "pmi_rate": float(pmi_rate),
+        "home_insurance": float(home_insurance),
+        "hoa_fee": float(hoa_fee),
+        "override_rate": float(override_rate) if override_rate is not None else None,
+        "override_term": int(override_term) if override_term is not None else None,
+    }
+
+    for name in ("home_value", "down_payment", "interest_rate", "property_tax",
+                 "pmi_rate", "home_insurance", "hoa_fee"):
+        if inputs[name] < 0:
+            raise ValueError(f"{name.replace('_', ' ').capitalize()} cannot be negative.")
+
+    if inputs["down_payment"] > inputs["home_value"]:
+        raise ValueError("Down payment cannot exceed the home value.")
+
+    if inputs["loan_term_years"] < 1 and not inputs["override_term"]:
+        raise ValueError("Loan term must be at least 1 year.")
 
-        if not results:
-            return pd.DataFrame()
-
-        loan_amount = float(home_value) - float(down_payment)
-        annual_interest_rate = float(interest_rate) / 100
-        if override_rate is not None and override_rate > 0:
-             annual_interest_rate = float(override_rate) / 100
-
-        loan_term_years = int(loan_term_years)
-        if override_term and override_term > 0:
-            loan_term_years = int(override_term)
-
-        monthly_rate = annual_interest_rate / 12
-        loan_term_months = loan_term_years * 12
-
-        if monthly_rate > 0:
-            monthly_payment_pi = (
-                loan_amount *
-                (monthly_rate * (1 + monthly_rate) ** loan_term_months) /
-                ((1 + monthly_rate) ** loan_term_months - 1)
-            )
-        else:
-            monthly_payment_pi = loan_amount / loan_term_months
-
-        schedule_data = []
-        balance = loan_amount
-
-        for year in range(1, loan_term_years + 1):
-            yearly_interest = 0.0
-            yearly_principal = 0.0
-
-            for month in range(12):
-                if balance <= 0:
-                    break
-                interest_payment = balance * monthly_rate
-                principal_payment = monthly_payment_pi - interest_payment
-                balance -= principal_payment
-
-                if balance < 0:
-                    principal_payment += balance
-                    balance = 0.0
-
-                yearly_interest += interest_payment
-                yearly_principal += principal_payment
-
-            schedule_data.append({
-                "Year": year,
-                "Date": start_date.replace(year=start_date.year + year - 1).strftime("%Y"),
-                "Principal": yearly_principal,
-                "Interest": yearly_interest,
-                "Ending Balance": balance
-            })
-
-            if balance <= 0:
-                # If loan is paid off, fill remaining years with zeros
-                for remaining_year in range(year + 1, loan_term_years + 1):
-                    schedule_data.append({
-                        "Year": remaining_year,
-                        "Date": start_date.replace(year=start_date.year + remaining_year - 1).strftime("%Y"),
-                        "Principal": 0.0,
-                        "Interest": 0.0,
-                        "Ending Balance": 0.0
-                    })
-                break
-
-        df_schedule = pd.DataFrame(schedule_data)
-        return df_schedule
-    except Exception as e:
-        st.error(f"An error occurred while generating the yearly schedule: {e}")
-        return pd.DataFrame()
-
-def generate_monthly_schedule(
+    for name in ("interest_rate", "override_rate"):
+        if inputs[name] is not None and inputs[name] > MAX_INTEREST_RATE:
+            raise ValueError(f"Interest rate cannot exceed {MAX_INTEREST_RATE:g}%.")
+
+    for name in ("loan_term_years", "override_term"):
+        if inputs[name] is not None and inputs[name] > MAX_LOAN_TERM_YEARS:
+            raise ValueError(f"Loan term cannot exceed {MAX_LOAN_TERM_YEARS} years.")
+
+    return inputs
+
+@st.cache_data(show_spinner=False)
+def calculate_mortgage(
     home_value,
     down_payment,
     interest_rate,
@@ -271,99 +170,142 @@ def generate_monthly_schedule(
     override_term=None
 ):
     """
-    Generate a monthly amortization schedule (first year + last year).
+    Calculate mortgage details. Expects inputs already checked by _validated_inputs.
     """
-    try:
-        results = calculate_mortgage(
-            home_value, down_payment, interest_rate, loan_term_years, start_date,
-            property_tax, pmi_rate, home_insurance, hoa_fee,
-            override_rate=override_rate, override_term=override_term
-        )
-
-        if not results:
-            return pd.DataFrame()
-
-        loan_amount = float(home_value) - float(down_payment)
-        annual_interest_rate = float(interest_rate) / 100
-        if override_rate is not None and override_rate > 0:
-             annual_interest_rate = float(override_rate) / 100
-
-        loan_term_years = int(loan_term_years)
-        if override_term and override_term > 0:
-            loan_term_years = int(override_term)
-
-        monthly_rate = annual_interest_rate / 12
-        loan_term_months = loan_term_years * 12
-
-        if monthly_rate > 0:
-            monthly_payment_pi = (
-                loan_amount *
-                (monthly_rate * (1 + monthly_rate) ** loan_term_months) /
-                ((1 + monthly_rate) ** loan_term_months - 1)
-            )
-        else:
-            monthly_payment_pi = loan_amount / loan_term_months
-
-        schedule_data = []
-        balance = loan_amount
-        current_date = start_date
-
-        total_months = loan_term_months
-
-        # Generate data for the first 12 months and the last 12 months
-        months_to_show = list(range(1, min(13, total_months + 1))) # First 12 months
-        if total_months > 12:
-            months_to_show.extend(range(max(total_months - 11, 13), total_months + 1)) # Last 12 months
-
-        for month in range(1, total_months + 1):
-            if month not in months_to_show:
-                # Skip months not in our display range
-                interest_payment = balance * monthly_rate
-                principal_payment = monthly_payment_pi - interest_payment
-                balance -= principal_payment
-                if balance < 0:
-                    balance = 0.0
-                continue
-
-            interest_payment = balance * monthly_rate
-            principal_payment = monthly_payment_pi - interest_payment
-            ending_balance = balance - principal_payment
-
-            # Ensure balance doesn't go negative
-            if ending_balance < 0:
-                principal_payment += ending_balance # Adjust last payment
-                ending_balance = 0.0
-
-            schedule_data.append({
-                "Month": month,
-                "Date": current_date.strftime("%b %Y"),
-                "Principal": principal_payment,
-                "Interest": interest_payment,
-                "Ending Balance": ending_balance
-            })
-
-            balance = ending_balance
-            # Move to next month
-            if current_date.month == 12:
-                current_date = current_date.replace(year=current_date.year + 1, month=1)
-            else:
-                current_date = current_date.replace(month=current_date.month + 1)
-
-            if balance <= 0:
-                break
+    interest_rate_decimal = interest_rate / 100
+
+    if override_term and override_term > 0:
+        loan_term_years = override_term
+
+    if override_rate is not None and override_rate > 0:
+        interest_rate_decimal = override_rate / 100
+
+    loan_term_months = loan_term_years * 12
+
+    pmi_rate_decimal = pmi_rate / 100
+
+    loan_amount = home_value - down_payment
+    monthly_interest_rate = interest_rate_decimal / 12
+
+    monthly_payment_principal_interest = _compute_pmt(loan_amount, monthly_interest_rate, loan_term_months)
+
+    pmi_monthly = loan_amount * pmi_rate_decimal / 12 if loan_amount > 0 else 0.0
+    property_tax_monthly = property_tax / 12 if property_tax > 0 else 0.0
+    home_insurance_monthly = home_insurance / 12 if home_insurance > 0 else 0.0
+
+    total_monthly_payment = (monthly_payment_principal_interest +
+                            property_tax_monthly + pmi_monthly +
+                            home_insurance_monthly + hoa_fee)
+
+    total_payments = total_monthly_payment * loan_term_months
+    total_interest_paid = (monthly_payment_principal_interest * loan_term_months) - loan_amount
+    annual_payment = total_monthly_payment * 12
+
+    # DateOffset rolls Feb 29 back to Feb 28 in non-leap payoff years
+    loan_payoff_date = pd.Timestamp(start_date) + pd.DateOffset(years=loan_term_years)
+
+    results = {
+        "Loan Amount": loan_amount,
+        "Monthly Payment (P&I)": monthly_payment_principal_interest,
+        "Total Monthly Payment": total_monthly_payment,
+        "Total Interest Paid": total_interest_paid,
+        "Loan Payoff Date": loan_payoff_date.strftime("%b %Y"),
+        "Annual Payment Amount": annual_payment,
+        "Total Payments": total_payments,
+        "Property Tax Per Month": property_tax_monthly,
+        "PMI Per Month": pmi_monthly,
+        "Home Insurance Per Month": home_insurance_monthly,
+        "HOA Fee Per Month": hoa_fee,
+        # Inputs for the schedule generators
+        "_loan_amount": loan_amount,
+        "_monthly_rate": monthly_interest_rate,
+        "_loan_term_months": loan_term_months,
+    }
 
-        df_schedule = pd.DataFrame(schedule_data)
-        return df_schedule
-    except Exception as e:
-        st.error(f"An error occurred while generating the monthly schedule: {e}")
-        return pd.DataFrame()
+    return results
 
-def plot_yearly_schedule(df_schedule, currency, selected_country):
-    """Plot the improved yearly amortization schedule."""
-    if df_schedule.empty:
-        st.warning("No data to display for the yearly schedule.")
-        return
 
+def _remaining_balance(loan_amount, monthly_rate, loan_term_months, months):
+    """
+    Closed-form loan balance after the given number(s) of monthly payments.
+    Written as a ratio of expm1 terms so it stays accurate when (1 + r) ** n is huge.
+    """
+    if monthly_rate > 0:
+        log_growth = np.log1p(monthly_rate)
+        balance = (loan_amount * -np.expm1((months - loan_term_months) * log_growth)
+                   / -np.expm1(-loan_term_months * log_growth))
+        return balance + 0.0  # turn the -0.0 at the final payment into 0.0
+    return loan_amount * (loan_term_months - months) / loan_term_months
+
+@st.cache_data(show_spinner=False)
+def generate_yearly_schedule(results, start_date):
+    """
+    Generate a yearly amortization schedule from calculate_mortgage results.
+    """
+    loan_amount = results["_loan_amount"]
+    monthly_rate = results["_monthly_rate"]
+    loan_term_months = results["_loan_term_months"]
+    loan_term_years = loan_term_months // 12
+
+    # Closed-form balance after every month; reaches exactly 0 at the final payment
+    months = np.arange(1, loan_term_months + 1)
+    balances = _remaining_balance(loan_amount, monthly_rate, loan_term_months, months)
+    opening_balances = np.concatenate(([max(loan_amount, 0.0)], balances[:-1]))
+
+    interest_payments = opening_balances * monthly_rate
+    principal_payments = opening_balances - balances
+
+    years = np.arange(1, loan_term_years + 1)
+    date_labels = (start_date.year + np.arange(loan_term_years)).astype(str)
+
+    df_schedule = pd.DataFrame({
+        "Year": years,
+        "Date": date_labels,
+        "Principal": principal_payments.reshape(loan_term_years, 12).sum(axis=1),
+        "Interest": interest_payments.reshape(loan_term_years, 12).sum(axis=1),
+        "Ending Balance": balances[11::12]
+    })
+    return df_schedule
+
+@st.cache_data(show_spinner=False)
+def generate_monthly_schedule(results, start_date):
+    """
+    Generate a monthly amortization schedule (first year + last year) from calculate_mortgage results.
+    """
+    loan_amount = results["_loan_amount"]
+    monthly_rate = results["_monthly_rate"]
+    total_months = results["_loan_term_months"]
+
+    # Only the first 12 months and the last 12 months are shown
+    months = np.concatenate([
+        np.arange(1, min(13, total_months + 1)),
+        np.arange(max(total_months - 11, 13), total_months + 1)
+    ])
+
+    ending_balances = _remaining_balance(loan_amount, monthly_rate, total_months, months)
+    opening_balances = _remaining_balance(loan_amount, monthly_rate, total_months, months - 1)
+
+    dates = pd.period_range(start=start_date, periods=total_months, freq="M")[months - 1]
+
+    df_schedule = pd.DataFrame({
+        "Month": months,
+        "Date": dates.strftime("%b %Y"),
+        "Principal": opening_balances - ending_balances,
+        "Interest": opening_balances * monthly_rate,
+        "Ending Balance": ending_balances
+    })
+    return df_schedule
+
+def _schedule_table(df_schedule, columns):
+    """Arrow table of the given schedule columns for st.dataframe display."""
+    return pa.table({col: df_schedule[col].to_numpy() for col in columns})
+
+def _hash_dataframe(df):
+    """Hash a schedule DataFrame by its contents for figure caching."""
+    return pd.util.hash_pandas_object(df).values.tobytes()
+
+def _build_yearly_figure(df_schedule, currency, selected_country):
+    """Build the yearly amortization figure (cheaper to rebuild than to restore from st.cache_data)."""
     # Create a line chart for Principal, Interest, and Balance
     fig = go.Figure()
 
@@ -415,18 +357,28 @@ def plot_yearly_schedule(df_schedule, currency, selected_country):
         height=500
     )
 
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
-def plot_monthly_schedule(df_schedule, currency, selected_country):
-    """Plot the monthly amortization schedule."""
+def plot_yearly_schedule(df_schedule, currency, selected_country):
+    """Plot the improved yearly amortization schedule."""
     if df_schedule.empty:
-        st.warning("No data to display for the monthly schedule.")
+        st.warning("No data to display for the yearly schedule.")
         return
 
+    st.plotly_chart(_build_yearly_figure(df_schedule, currency, selected_country), width="stretch")
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: _hash_dataframe})
+def _build_monthly_figure(df_schedule, currency, selected_country):
+    """Build the monthly amortization figure."""
     # Create a stacked area chart for Principal and Interest
-    # Melt the DataFrame for easier plotting
-    df_plot = df_schedule.melt(id_vars=['Month', 'Date'], value_vars=['Principal', 'Interest'],
-                               var_name='Component', value_name='Amount')
+    # Stack Principal and Interest into long format (equivalent to melt, without the reshape)
+    n = len(df_schedule)
+    df_plot = pd.DataFrame({
+        'Month': np.tile(df_schedule['Month'].to_numpy(), 2),
+        'Date': np.tile(df_schedule['Date'].to_numpy(), 2),
+        'Component': np.repeat(['Principal', 'Interest'], n),
+        'Amount': np.concatenate([df_schedule['Principal'].to_numpy(), df_schedule['Interest'].to_numpy()])
+    })
 
     fig = px.area(
         df_plot,
@@ -453,14 +405,22 @@ def plot_monthly_schedule(df_schedule, currency, selected_country):
         height=500
     )
 
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
+
+def plot_monthly_schedule(df_schedule, currency, selected_country):
+    """Plot the monthly amortization schedule."""
+    if df_schedule.empty:
+        st.warning("No data to display for the monthly schedule.")
+        return
+
+    st.plotly_chart(_build_monthly_figure(df_schedule, currency, selected_country), width="stretch")
 
 # === Main App Logic ===
 st.title("Mortgage Calculator Dashboard")
 
 with st.sidebar:
     st.header("Configuration")
-    selected_country = st.selectbox("Select Country", list(COUNTRIES.keys()))
+    selected_country = st.selectbox("Select Country", COUNTRY_NAMES)
     currency = COUNTRIES[selected_country]["currency"]
     default_rate = COUNTRIES[selected_country]["default_rate"]
     flag = COUNTRIES[selected_country]["flag"]
@@ -471,6 +431,7 @@ with st.sidebar:
     override_rate = st.number_input(
         "Override Interest Rate (%)",
         min_value=0.0,
+        max_value=MAX_INTEREST_RATE,
         value=0.0,
         step=0.01,
         format="%.2f",
@@ -479,6 +440,7 @@ with st.sidebar:
     override_term = st.number_input(
         "Override Loan Term (Years)",
         min_value=0,
+        max_value=MAX_LOAN_TERM_YEARS,
         value=0,
         step=1,
         help="Enter 0 to use the term from the main input field"
@@ -491,8 +453,8 @@ with col1:
     home_value = st.number_input("Home Value", min_value=0.0, value=400000.0, step=1000.0, format="%.2f")
     down_payment = st.number_input("Down Payment", min_value=0.0, value=80000.0, step=1000.0, format="%.2f")
     display_rate = override_rate if override_rate > 0 else default_rate
-    interest_rate = st.number_input("Interest Rate (%)", min_value=0.0, value=display_rate, step=0.01, format="%.2f")
-    loan_term_years = st.number_input("Loan Term (Years)", min_value=1, value=30, step=1)
+    interest_rate = st.number_input("Interest Rate (%)", min_value=0.0, max_value=MAX_INTEREST_RATE, value=display_rate, step=0.01, format="%.2f")
+    loan_term_years = st.number_input("Loan Term (Years)", min_value=1, max_value=MAX_LOAN_TERM_YEARS, value=30, step=1)
 
 with col2:
     st.subheader("Additional Costs & Start Date")
@@ -505,42 +467,28 @@ with col2:
     st.markdown("**Homeowners Association (HOA) Fee:** Monthly fee for community maintenance.")
     hoa_fee = st.number_input(f"Monthly HOA Fee ({currency})", min_value=0.0, value=0.0, step=10.0, format="%.2f")
 
-if st.button("Calculate", type="primary"):
-    final_override_rate = override_rate if override_rate > 0 else None
-    final_override_term = override_term if override_term > 0 else None
-
-    results = calculate_mortgage(
-        home_value,
-        down_payment,
-        interest_rate,
-        loan_term_years,
-        start_date,
-        property_tax,
-        pmi_rate,
-        home_insurance,
-        hoa_fee,
-        override_rate=final_override_rate,
-        override_term=final_override_term
-    )
+final_override_rate = override_rate if override_rate > 0 else None
+final_override_term = override_term if override_term > 0 else None
+
+# Raw widget values, used to tell whether stored results still match the inputs
+raw_inputs = {
+    "country": selected_country,
+    "home_value": home_value,
+    "down_payment": down_payment,
+    "interest_rate": interest_rate,
+    "loan_term_years": loan_term_years,
+    "start_date": start_date,
+    "property_tax": property_tax,
+    "pmi_rate": pmi_rate,
+    "home_insurance": home_insurance,
+    "hoa_fee": hoa_fee,
+    "override_rate": final_override_rate,
+    "override_term": final_override_term,
+}
 
-    if results:
-        st.subheader("Loan Summary")
-        st.markdown(f"Here's a breakdown of your estimated {selected_country} mortgage:")
-
-        sum_col1, sum_col2, sum_col3 = st.columns(3)
-        with sum_col1:
-            st.metric(label="🏠 Loan Amount", value=f"{results['Loan Amount']:,.2f} {currency}")
-            st.metric(label="💰 Monthly Payment (P&I)", value=f"{results['Monthly Payment (P&I)']:.2f} {currency}")
-        with sum_col2:
-            st.metric(label="📉 Total Interest Paid", value=f"{results['Total Interest Paid']:,.2f} {currency}")
-            st.metric(label="📅 Loan Payoff Date", value=results['Loan Payoff Date'])
-        with sum_col3:
-            st.metric(label="📊 Total Payments", value=f"{results['Total Payments']:,.2f} {currency}")
-            st.metric(label="📈 Annual Payment", value=f"{results['Annual Payment Amount']:,.2f} {currency}")
-
-        # --- Amortization Schedules ---
-        # Yearly Schedule
-        df_yearly_schedule = generate_yearly_schedule(
+if st.button("Calculate", type="primary"):
+    try:
+        mortgage_inputs = _validated_inputs(
             home_value,
             down_payment,
             interest_rate,
@@ -553,77 +501,99 @@ if st.button("Calculate", type="primary"):
             override_rate=final_override_rate,
             override_term=final_override_term
         )
+        # Keep the calculation across reruns (e.g. switching schedule tabs)
+        st.session_state["mortgage_inputs"] = {
+            "raw": raw_inputs,
+            "inputs": mortgage_inputs,
+            "results": calculate_mortgage(**mortgage_inputs),
+        }
+    except ValueError as e:
+        st.session_state.pop("mortgage_inputs", None)
+        st.error(f"An error occurred during calculation: {e}")
 
-        # Monthly Schedule (Sample)
-        df_monthly_schedule = generate_monthly_schedule(
-            home_value,
-            down_payment,
-            interest_rate,
-            loan_term_years,
-            start_date,
-            property_tax,
-            pmi_rate,
-            home_insurance,
-            hoa_fee,
-            override_rate=final_override_rate,
-            override_term=final_override_term
-        )
+calculation = st.session_state.get("mortgage_inputs")
+if calculation and calculation["raw"] != raw_inputs:
+    st.info("The inputs have changed. Click Calculate to update the results.")
+    calculation = None
+
+if calculation:
+    results = calculation["results"]
+    result_start_date = calculation["inputs"]["start_date"]
+
+    st.subheader("Loan Summary")
+    st.markdown(f"Here's a breakdown of your estimated {selected_country} mortgage:")
+
+    sum_col1, sum_col2, sum_col3 = st.columns(3)
+    with sum_col1:
+        st.metric(label="🏠 Loan Amount", value=f"{results['Loan Amount']:,.2f} {currency}")
+        st.metric(label="💰 Monthly Payment (P&I)", value=f"{results['Monthly Payment (P&I)']:.2f} {currency}")
+    with sum_col2:
+        st.metric(label="📉 Total Interest Paid", value=f"{results['Total Interest Paid']:,.2f} {currency}")
+        st.metric(label="📅 Loan Payoff Date", value=results['Loan Payoff Date'])
+    with sum_col3:
+        st.metric(label="📊 Total Payments", value=f"{results['Total Payments']:,.2f} {currency}")
+        st.metric(label="📈 Annual Payment", value=f"{results['Annual Payment Amount']:,.2f} {currency}")
+
+    # --- Amortization Schedules ---
+    st.subheader("Loan Amortization Schedule")
+    currency_column = st.column_config.NumberColumn(format=f"%,.2f {currency}")
+
+    # Tabs for Yearly and Monthly; only the open tab builds its schedule and chart
+    tab_yearly, tab_monthly = st.tabs(
+        ["Yearly Breakdown", "Monthly Breakdown (Sample)"], key="schedule_tab", on_change="rerun"
+    )
 
-        if not df_yearly_schedule.empty or not df_monthly_schedule.empty:
-            st.subheader("Loan Amortization Schedule")
-
-            # Tabs for Yearly and Monthly
-            tab_yearly, tab_monthly = st.tabs(["Yearly Breakdown", "Monthly Breakdown (Sample)"])
-
-            with tab_yearly:
-                if not df_yearly_schedule.empty:
-                    st.markdown("This chart shows the yearly breakdown of principal, interest, and remaining loan balance.")
-                    plot_yearly_schedule(df_yearly_schedule, currency, selected_country)
-
-                    with st.expander("See detailed yearly schedule data"):
-                        formatted_yearly_df = df_yearly_schedule.copy()
-                        for col in formatted_yearly_df.select_dtypes(include=['number']).columns:
-                            if col != 'Year': # Don't add currency to 'Year'
-                                formatted_yearly_df[col] = formatted_yearly_df[col].apply(lambda x: f"{x:,.2f} {currency}")
-                        # Drop the 'Year' column for display as requested previously, but it's useful for plotting
-                        display_yearly_df = formatted_yearly_df.drop(columns=['Year'])
-                        st.dataframe(display_yearly_df, use_container_width=True)
-                else:
-                    st.warning("Yearly schedule could not be generated.")
-
-            with tab_monthly:
-                if not df_monthly_schedule.empty:
-                    st.markdown("This chart shows the monthly breakdown of principal and interest for the first and last year of the loan.")
-                    plot_monthly_schedule(df_monthly_schedule, currency, selected_country)
-
-                    with st.expander("See detailed monthly schedule data (Sample)"):
-                        formatted_monthly_df = df_monthly_schedule.copy()
-                        for col in formatted_monthly_df.select_dtypes(include=['number']).columns:
-                            if col != 'Month': # Don't add currency to 'Month'
-                                formatted_monthly_df[col] = formatted_monthly_df[col].apply(lambda x: f"{x:,.2f} {currency}")
-                        # Drop the 'Month' column for display as it's less critical in the table view
-                        display_monthly_df = formatted_monthly_df.drop(columns=['Month'])
-                        st.dataframe(display_monthly_df, use_container_width=True)
-                else:
-                    st.warning("Monthly schedule could not be generated.")
-
-
-        # --- Monthly Payment Breakdown ---
-        st.subheader("Monthly Payment Breakdown")
-        st.markdown("Here's how your total monthly payment is calculated:")
-        breakdown_col1, breakdown_col2, breakdown_col3 = st.columns(3)
-        with breakdown_col1:
-            st.metric(label="Principal & Interest", value=f"{results['Monthly Payment (P&I)']:.2f} {currency}")
-        with breakdown_col2:
-            st.metric(label="Property Tax", value=f"{results['Property Tax Per Month']:.2f} {currency}")
-            st.metric(label="PMI", value=f"{results['PMI Per Month']:.2f} {currency}")
-        with breakdown_col3:
-            st.metric(label="Home Insurance", value=f"{results['Home Insurance Per Month']:.2f} {currency}")
-            st.metric(label="HOA Fee", value=f"{results['HOA Fee Per Month']:.2f} {currency}")
-
-        st.markdown("---")
-        st.markdown(f"**Total Monthly Payment:** **{results['Total Monthly Payment']:.2f} {currency}**")
-        st.markdown("*This estimate includes principal, interest, taxes, insurance, and HOA fees.*")
+    with tab_yearly:
+        if tab_yearly.open:
+            df_yearly_schedule = generate_yearly_schedule(results, result_start_date)
+            if not df_yearly_schedule.empty:
+                st.markdown("This chart shows the yearly breakdown of principal, interest, and remaining loan balance.")
+                plot_yearly_schedule(df_yearly_schedule, currency, selected_country)
+
+                with st.expander("See detailed yearly schedule data"):
+                    # Leave out the 'Year' column for display as requested previously, but it's useful for plotting
+                    st.dataframe(
+                        _schedule_table(df_yearly_schedule, ("Date",) + NUMERIC_COLS_YEARLY),
+                        column_config={col: currency_column for col in NUMERIC_COLS_YEARLY},
+                        width="stretch"
+                    )
+            else:
+                st.warning("Yearly schedule could not be generated.")
+
+    with tab_monthly:
+        if tab_monthly.open:
+            df_monthly_schedule = generate_monthly_schedule(results, result_start_date)
+            if not df_monthly_schedule.empty:
+                st.markdown("This chart shows the monthly breakdown of principal and interest for the first and last year of the loan.")
+                plot_monthly_schedule(df_monthly_schedule, currency, selected_country)
+
+                with st.expander("See detailed monthly schedule data (Sample)"):
+                    # Leave out the 'Month' column for display as it's less critical in the table view
+                    st.dataframe(
+                        _schedule_table(df_monthly_schedule, ("Date",) + NUMERIC_COLS_MONTHLY),
+                        column_config={col: currency_column for col in NUMERIC_COLS_MONTHLY},
+                        width="stretch"
+                    )
+            else:
+                st.warning("Monthly schedule could not be generated.")
+
+
+    # --- Monthly Payment Breakdown ---
+    st.subheader("Monthly Payment Breakdown")
+    st.markdown("Here's how your total monthly payment is calculated:")
+    breakdown_col1, breakdown_col2, breakdown_col3 = st.columns(3)
+    with breakdown_col1:
+        st.metric(label="Principal & Interest", value=f"{results['Monthly Payment (P&I)']:.2f} {currency}")
+    with breakdown_col2:
+        st.metric(label="Property Tax", value=f"{results['Property Tax Per Month']:.2f} {currency}")
+        st.metric(label="PMI", value=f"{results['PMI Per Month']:.2f} {currency}")
+    with breakdown_col3:
+        st.metric(label="Home Insurance", value=f"{results['Home Insurance Per Month']:.2f} {currency}")
+        st.metric(label="HOA Fee", value=f"{results['HOA Fee Per Month']:.2f} {currency}")
+
+    st.markdown("---")
+    st.markdown(f"**Total Monthly Payment:** **{results['Total Monthly Payment']:.2f} {currency}**")
+    st.markdown("*This estimate includes principal, interest, taxes, insurance, and HOA fees.*")
 
 st.markdown("---")
 st.caption("© 2025 Mortgage Calculator Dashboard")